@@ -0,0 +1,157 @@
+import argparse
+from sds_run.config_loader import load_config
+from sds_run.job_queue import JobQueue, submit_jobs, run_worker
+from colorama import init, Fore
+
+def main():
+
+    init(autoreset=True)
+    parser = argparse.ArgumentParser(
+        description='Run SMART-DS simulations on several nodes through a job queue on a shared filesystem.')
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    # --- Coordinator ---
+    submit_parser = subparsers.add_parser(
+        "submit",
+        help="Write the job descriptors for a simulation sweep into the queue.")
+    submit_parser.add_argument(
+        "queue_dir",
+        type=str,
+        help="The queue directory. It must be on a filesystem shared by all nodes.")
+    submit_parser.add_argument(
+        "scenario",
+        type=str,
+        help="The name of the simulation scenario (e.g., 'base_timeseries')")
+    submit_parser.add_argument(
+        "start_date",
+        type=str,
+        help="The simulation start date in YYYY-MM-DD format")
+    submit_parser.add_argument(
+        "days",
+        type=int,
+        help="The number of days to simulate.")
+    submit_parser.add_argument(
+        "-c", "--city",
+        type=str,
+        default="SFO",
+        help="City code for the dataset. Default: SFO.")
+    submit_parser.add_argument(
+        "-sr", "--subregion",
+        type=str,
+        default="P13U",
+        help="Sub-region code for the dataset. Default: P13U.")
+    submit_parser.add_argument(
+        "-ss", "--substation",
+        type=str,
+        default=None,
+        help="Substation name. If omitted, the entire subregion is simulated.")
+    submit_parser.add_argument(
+        "-f", "--feeder",
+        type=str,
+        default=None,
+        help="Feeder name. Requires --substation to be set.")
+    submit_parser.add_argument(
+        "--split-feeders",
+        action="store_true",
+        help="Create one job per feeder inside the sub-region or substation.")
+    submit_parser.add_argument(
+        "--chunk-days",
+        type=int,
+        default=None,
+        help="Maximum number of days per job. If omitted, each job covers the whole period.")
+
+    # --- Worker ---
+    work_parser = subparsers.add_parser(
+        "work",
+        help="Claim and run jobs from the queue until it is drained.")
+    work_parser.add_argument(
+        "queue_dir",
+        type=str,
+        help="The queue directory shared with the coordinator.")
+    work_parser.add_argument(
+        "--worker-id",
+        type=str,
+        default=None,
+        help="Name recorded in the leases. Default: <hostname>-<pid>.")
+    work_parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=5.0,
+        help="Seconds to wait while other workers still hold leases. Default: 5.")
+    work_parser.add_argument(
+        "--lease-timeout",
+        type=float,
+        default=300.0,
+        help="Seconds without a heartbeat before a lease is re-queued. Default: 300.")
+    work_parser.add_argument(
+        "--heartbeat-interval",
+        type=float,
+        default=30.0,
+        help="Seconds between lease heartbeats. Default: 30.")
+    work_parser.add_argument(
+        "--max-attempts",
+        type=int,
+        default=3,
+        help="Number of claims a job gets before a stale lease marks it as failed. Default: 3.")
+    work_parser.add_argument(
+        "--max-jobs",
+        type=int,
+        default=None,
+        help="Stop after running this many jobs.")
+
+    # --- Status ---
+    status_parser = subparsers.add_parser(
+        "status",
+        help="Show the number of jobs in each state.")
+    status_parser.add_argument(
+        "queue_dir",
+        type=str,
+        help="The queue directory.")
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == "submit":
+            if args.feeder and not args.substation:
+                parser.error("The --feeder argument requires the --substation argument to be specified.")
+            config = load_config('config.yaml')
+            submitted = submit_jobs(
+                queue_dir=args.queue_dir,
+                config=config,
+                scenario=args.scenario,
+                start_date=args.start_date,
+                days=args.days,
+                city=args.city,
+                subregion=args.subregion,
+                substation=args.substation,
+                feeder=args.feeder,
+                split_feeders=args.split_feeders,
+                chunk_days=args.chunk_days
+            )
+            print(Fore.GREEN + f"{len(submitted)} job(s) added to the queue.")
+
+        elif args.command == "work":
+            summary = run_worker(
+                queue_dir=args.queue_dir,
+                worker_id=args.worker_id,
+                poll_interval=args.poll_interval,
+                lease_timeout=args.lease_timeout,
+                heartbeat_interval=args.heartbeat_interval,
+                max_attempts=args.max_attempts,
+                max_jobs=args.max_jobs
+            )
+            print(Fore.GREEN + f"Worker finished: {summary['done']} job(s) done, {summary['failed']} failed.")
+
+        elif args.command == "status":
+            for state, count in JobQueue(args.queue_dir).counts().items():
+                print(f"  - {state}: {count}")
+
+    except (FileNotFoundError, ValueError) as e:
+        print(e)
+        exit(1)
+    except Exception as e:
+        print(f"An unexpected error occurred: {e}")
+        exit(1)
+
+if __name__ == "__main__":
+    main()
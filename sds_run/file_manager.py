@@ -1,6 +1,6 @@
 import os
 import pandas as pd
-from typing import Dict
+from typing import Dict, List, Tuple
 
 def get_dss_master_file_path(
     circuit_base_path: str,
@@ -48,6 +48,56 @@ def get_dss_master_file_path(
 
     return dss_file
 
+def list_feeder_scopes(
+    circuit_base_path: str,
+    city: str,
+    subregion: str,
+    year: str,
+    scenario: str,
+    substation: str = None
+) -> List[Tuple[str, str]]:
+    """
+    Lists every (substation, feeder) pair that has a valid Master.dss file
+    inside a sub-region, or inside a single substation when one is given.
+
+    Args:
+        circuit_base_path (str): Base folder containing the SMART-DS circuit models.
+        city (str): City code for the dataset.
+        subregion (str): Sub-region code for the dataset.
+        year (str): The dataset year.
+        scenario (str): The SMART-DS scenario name.
+        substation (str, optional): Restricts the search to this substation. Defaults to None.
+
+    Returns:
+        List[Tuple[str, str]]: The (substation, feeder) pairs, sorted by name.
+    """
+    opendss_path = os.path.join(
+        circuit_base_path, year, city, subregion, "scenarios",
+        scenario, "opendss"
+    )
+    if not os.path.isdir(opendss_path):
+        raise FileNotFoundError(f"Circuit directory not found for the specified level: {opendss_path}")
+
+    if substation:
+        if not os.path.isdir(os.path.join(opendss_path, substation)):
+            raise FileNotFoundError(
+                f"Circuit directory not found for the specified level: {os.path.join(opendss_path, substation)}")
+        substations = [substation]
+    else:
+        substations = sorted(os.listdir(opendss_path))
+
+    scopes = []
+    for substation_name in substations:
+        substation_path = os.path.join(opendss_path, substation_name)
+        if not os.path.isdir(substation_path):
+            continue
+        for feeder_name in sorted(os.listdir(substation_path)):
+            # Só considera pastas que contêm um modelo completo do alimentador
+            if os.path.isfile(os.path.join(substation_path, feeder_name, "Master.dss")):
+                scopes.append((substation_name, feeder_name))
+
+    return scopes
+
 def save_results_as_parquet(
     results_dict: Dict[str, pd.DataFrame],
     saving_dir: str,
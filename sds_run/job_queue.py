@@ -0,0 +1,486 @@
+import argparse
+import json
+import os
+import socket
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+from colorama import Fore
+from sds_run.file_manager import get_dss_master_file_path, list_feeder_scopes
+
+# Each job descriptor lives in exactly one of these folders. Moving a file
+# between them with os.rename is atomic on a shared filesystem, so the
+# folder a descriptor is in is the job's state.
+PENDING = 'pending'
+LEASED = 'leased'
+DONE = 'done'
+FAILED = 'failed'
+JOB_STATES = (PENDING, LEASED, DONE, FAILED)
+
+
+def build_job_id(
+    scenario: str,
+    start_date: str,
+    days: int,
+    subregion: str,
+    substation: str = None,
+    feeder: str = None
+) -> str:
+    """
+    Builds a deterministic job id from the simulation scope and date window,
+    so that submitting the same sweep twice does not duplicate jobs.
+    """
+    if feeder:
+        scope_name = feeder
+    elif substation:
+        scope_name = substation
+    else:
+        scope_name = subregion
+    return f"{scenario}__{scope_name}__{start_date}_{days}_days"
+
+
+def split_date_window(start_date: str, days: int, chunk_days: int = None) -> List[tuple]:
+    """
+    Splits a date window into consecutive (start_date, days) chunks.
+
+    Args:
+        start_date (str): The window start date in 'YYYY-MM-DD' format.
+        days (int): The total number of days in the window.
+        chunk_days (int, optional): Maximum number of days per chunk.
+            If omitted, the whole window is a single chunk.
+
+    Returns:
+        List[tuple]: A list of (start_date, days) tuples.
+    """
+    try:
+        start_date_obj = datetime.strptime(start_date, '%Y-%m-%d')
+    except ValueError:
+        raise ValueError(f"Invalid Format: '{start_date}'. Use YYYY-MM-DD.")
+    if days <= 0:
+        raise ValueError("The number of days must be an integer, positive and greater than 0.")
+    if chunk_days is not None and chunk_days <= 0:
+        raise ValueError("The number of days per job must be an integer, positive and greater than 0.")
+
+    end_date = start_date_obj + timedelta(days=days - 1)
+    if start_date_obj.year != end_date.year:
+        raise ValueError("Simulation Period Invalid. It ends in the next Year.")
+
+    chunk_days = chunk_days or days
+    chunks = []
+    offset = 0
+    while offset < days:
+        chunk_start = start_date_obj + timedelta(days=offset)
+        chunks.append((chunk_start.strftime('%Y-%m-%d'), min(chunk_days, days - offset)))
+        offset += chunk_days
+    return chunks
+
+
+class LeaseHeartbeat:
+    """
+    Keeps a lease alive by refreshing its modification time from a background thread.
+    The heartbeat stops for good, and sets `lost`, once the lease file is gone.
+    """
+    def __init__(self, lease_path: str, interval: float = 30.0, grace: float = 1.0):
+        self.lease_path = lease_path
+        self.interval = interval
+        self.grace = grace
+        self.lost = False
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def _beat(self):
+        while not self.stop_event.wait(self.interval):
+            try:
+                os.utime(self.lease_path)
+            except FileNotFoundError:
+                # A reaper may be holding the lease for a moment while checking
+                # it; if it is still missing after the grace period, it was re-queued.
+                if self.stop_event.wait(self.grace):
+                    return
+                if not os.path.exists(self.lease_path):
+                    self.lost = True
+                    return
+
+    def start(self):
+        """Starts the heartbeat in a separate thread."""
+        if self.thread is not None:
+            return
+        self.thread = threading.Thread(target=self._beat, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Stops the heartbeat thread."""
+        if self.thread is None:
+            return
+        self.stop_event.set()
+        self.thread.join()
+        self.thread = None
+
+
+class JobQueue:
+    """
+    A job queue kept in a directory on a shared filesystem.
+
+    Job descriptors are JSON files. Workers claim a job by renaming it from
+    'pending' into 'leased' under a name that includes a token unique to
+    that claim; only one rename can succeed, so only one worker gets the
+    job, and a worker whose lease was re-queued can never touch the lease
+    of the next claim. While it runs, the worker refreshes the lease file's
+    modification time. Leases that stop being refreshed are moved back to
+    'pending' by any worker, or to 'failed' once the job has used all its attempts.
+    """
+    def __init__(self, queue_dir: str):
+        self.queue_dir = os.path.abspath(queue_dir)
+        for state in JOB_STATES:
+            os.makedirs(self._state_dir(state), exist_ok=True)
+
+    def _state_dir(self, state: str) -> str:
+        return os.path.join(self.queue_dir, state)
+
+    def _job_path(self, state: str, job_id: str) -> str:
+        return os.path.join(self._state_dir(state), f"{job_id}.json")
+
+    def _lease_path(self, job_id: str, token: str) -> str:
+        return os.path.join(self._state_dir(LEASED), f"{job_id}.{token}.lease")
+
+    def _leases(self) -> List[tuple]:
+        """Returns the (job_id, token) pair of every lease."""
+        leases = []
+        for name in os.listdir(self._state_dir(LEASED)):
+            if name.endswith('.lease'):
+                # Tokens are uuid hex strings, so the last dot separates them from the id
+                job_id, token = name[:-len('.lease')].rsplit('.', 1)
+                leases.append((job_id, token))
+        return sorted(leases)
+
+    def _job_ids(self, state: str) -> List[str]:
+        if state == LEASED:
+            return [job_id for job_id, _ in self._leases()]
+        # Temporary files use other suffixes, so they are never listed as jobs
+        return sorted(
+            name[:-len('.json')] for name in os.listdir(self._state_dir(state))
+            if name.endswith('.json')
+        )
+
+    @staticmethod
+    def _read(path: str) -> Dict:
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    @staticmethod
+    def _write(path: str, job: Dict):
+        """Writes a descriptor atomically, so readers never see a partial file."""
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(job, f, indent=2)
+        os.replace(tmp_path, path)
+
+    def lease_path(self, job: Dict) -> str:
+        """Returns the path of the lease file for a claimed job."""
+        return self._lease_path(job['job_id'], job['lease_token'])
+
+    def exists(self, job_id: str) -> bool:
+        """Checks whether a job is present in any state."""
+        if job_id in self._job_ids(LEASED):
+            return True
+        return any(os.path.exists(self._job_path(state, job_id)) for state in (PENDING, DONE, FAILED))
+
+    def counts(self) -> Dict[str, int]:
+        """Returns the number of jobs in each state."""
+        return {state: len(self._job_ids(state)) for state in JOB_STATES}
+
+    def put(self, job: Dict) -> bool:
+        """
+        Adds a job descriptor to the pending folder.
+
+        Returns:
+            bool: False if a job with the same id is already in the queue.
+        """
+        if self.exists(job['job_id']):
+            return False
+        self._write(self._job_path(PENDING, job['job_id']), job)
+        return True
+
+    def claim(self, worker_id: str) -> Optional[Dict]:
+        """
+        Claims the next pending job for a worker.
+
+        Returns:
+            Optional[Dict]: The claimed job descriptor, or None if nothing is pending.
+        """
+        for job_id in self._job_ids(PENDING):
+            pending_path = self._job_path(PENDING, job_id)
+            token = uuid.uuid4().hex
+            lease_path = self._lease_path(job_id, token)
+            try:
+                # The rename keeps the modification time, so refresh it first
+                # to stop the new lease from looking stale right away.
+                os.utime(pending_path)
+                os.rename(pending_path, lease_path)
+            except FileNotFoundError:
+                # Another worker got this job first
+                continue
+
+            job = self._read(lease_path)
+            job['attempts'] = job.get('attempts', 0) + 1
+            job['worker'] = worker_id
+            job['lease_token'] = token
+            job['claimed_at'] = time.time()
+            self._write(lease_path, job)
+            return job
+        return None
+
+    def release(self, job: Dict, state: str, retries: int = 3, retry_delay: float = 1.0) -> bool:
+        """
+        Moves a leased job to its final state ('done' or 'failed').
+
+        Returns:
+            bool: False if the lease was lost, i.e. the job was re-queued
+                  by another worker after its heartbeat went stale. The
+                  queue is left untouched in that case.
+        """
+        lease_path = self.lease_path(job)
+        final_path = self._job_path(state, job['job_id'])
+        for attempt in range(retries):
+            try:
+                os.rename(lease_path, final_path)
+                break
+            except FileNotFoundError:
+                # A reaper may be holding the lease for a moment while checking it
+                if attempt < retries - 1:
+                    time.sleep(retry_delay)
+        else:
+            return False
+
+        job.pop('lease_token', None)
+        job['finished_at'] = time.time()
+        self._write(final_path, job)
+        return True
+
+    def requeue_stale(self, lease_timeout: float, max_attempts: int) -> List[str]:
+        """
+        Moves leases whose heartbeat is older than `lease_timeout` seconds back
+        to 'pending', or to 'failed' once the job has used `max_attempts` attempts.
+
+        Returns:
+            List[str]: The ids of the jobs that were moved.
+        """
+        moved = []
+        for job_id, token in self._leases():
+            lease_path = self._lease_path(job_id, token)
+            try:
+                if time.time() - os.path.getmtime(lease_path) < lease_timeout:
+                    continue
+                # Take the lease out of the way so no other reaper touches it
+                held_path = f"{lease_path}.{uuid.uuid4().hex}.reap"
+                os.rename(lease_path, held_path)
+            except FileNotFoundError:
+                continue
+
+            # The owner may have sent a heartbeat between the check and the
+            # rename; a fresh lease belongs to a live worker.
+            if time.time() - os.path.getmtime(held_path) < lease_timeout:
+                os.rename(held_path, lease_path)
+                continue
+
+            job = self._read(held_path)
+            stale_worker = job.pop('worker', None)
+            job.pop('lease_token', None)
+            if job.get('attempts', 0) >= max_attempts:
+                job['error'] = f"Lease expired after {job.get('attempts', 0)} attempt(s), last held by {stale_worker}."
+                self._write(self._job_path(FAILED, job_id), job)
+            else:
+                self._write(self._job_path(PENDING, job_id), job)
+            os.remove(held_path)
+            moved.append(job_id)
+        return moved
+
+
+def submit_jobs(
+    queue_dir: str,
+    config: Dict,
+    scenario: str,
+    start_date: str,
+    days: int,
+    city: str,
+    subregion: str,
+    substation: str = None,
+    feeder: str = None,
+    split_feeders: bool = False,
+    chunk_days: int = None
+) -> List[str]:
+    """
+    Coordinator side: writes one job descriptor per scope and date chunk.
+
+    Args:
+        queue_dir (str): The queue directory on the shared filesystem.
+        config (Dict): Configuration dictionary loaded from config.yaml.
+        scenario (str): The SMART-DS scenario name.
+        start_date (str): The window start date in 'YYYY-MM-DD' format.
+        days (int): The number of days in the window.
+        city (str): City code for the dataset.
+        subregion (str): Sub-region code for the dataset.
+        substation (str, optional): Substation name. Defaults to None.
+        feeder (str, optional): Feeder name. Defaults to None.
+        split_feeders (bool): Creates one job per feeder found inside the
+            sub-region or substation instead of a single job for the whole scope.
+        chunk_days (int, optional): Maximum number of days per job.
+
+    Returns:
+        List[str]: The ids of the jobs added to the queue. Jobs already in
+                   the queue are skipped.
+    """
+    if feeder and not substation:
+        raise ValueError("The feeder argument requires the substation argument to be specified.")
+
+    chunks = split_date_window(start_date, days, chunk_days)
+    year = start_date[:4]
+
+    # Workers may run from any folder on any node, so the paths written into
+    # the descriptors must be absolute.
+    job_config = config.copy()
+    job_config['circuit_base_path'] = os.path.abspath(config['circuit_base_path'])
+    job_config['results_base_path'] = os.path.abspath(config['results_base_path'])
+
+    if split_feeders and not feeder:
+        scopes = list_feeder_scopes(
+            circuit_base_path=job_config['circuit_base_path'],
+            city=city,
+            subregion=subregion,
+            year=year,
+            scenario=scenario,
+            substation=substation
+        )
+        if not scopes:
+            raise FileNotFoundError("No feeders with a Master.dss file were found in the specified scope.")
+    else:
+        scopes = [(substation, feeder)]
+
+    queue = JobQueue(queue_dir)
+    submitted = []
+    for scope_substation, scope_feeder in scopes:
+        dss_file = get_dss_master_file_path(
+            circuit_base_path=job_config['circuit_base_path'],
+            city=city,
+            subregion=subregion,
+            year=year,
+            scenario=scenario,
+            substation=scope_substation,
+            feeder=scope_feeder
+        )
+        for chunk_start, chunk_n_days in chunks:
+            job = {
+                'job_id': build_job_id(scenario, chunk_start, chunk_n_days, subregion, scope_substation, scope_feeder),
+                'scenario': scenario,
+                'start_date': chunk_start,
+                'days': chunk_n_days,
+                'city': city,
+                'subregion': subregion,
+                'substation': scope_substation,
+                'feeder': scope_feeder,
+                'dss_file': dss_file,
+                'config': job_config,
+                'attempts': 0,
+                'submitted_at': time.time(),
+            }
+            if queue.put(job):
+                submitted.append(job['job_id'])
+    return submitted
+
+
+def run_job_with_pipeline(job: Dict):
+    """Runs a job descriptor through the regular simulation pipeline."""
+    # Imported here so that submitting, checking the status or running workers
+    # with another runner does not require OpenDSS to be installed.
+    from sds_run.main import run_pipeline
+
+    args = argparse.Namespace(
+        scenario=job['scenario'],
+        start_date=job['start_date'],
+        days=job['days'],
+        city=job['city'],
+        subregion=job['subregion'],
+        substation=job['substation'],
+        feeder=job['feeder']
+    )
+    run_pipeline(args, job['config'])
+
+
+def run_worker(
+    queue_dir: str,
+    runner: Callable[[Dict], None] = run_job_with_pipeline,
+    worker_id: str = None,
+    poll_interval: float = 5.0,
+    lease_timeout: float = 300.0,
+    heartbeat_interval: float = 30.0,
+    max_attempts: int = 3,
+    max_jobs: int = None
+) -> Dict[str, int]:
+    """
+    Worker side: claims and runs jobs until the queue is drained.
+
+    The worker exits when there are no pending jobs and no leases left that
+    could still be re-queued.
+
+    Args:
+        queue_dir (str): The queue directory on the shared filesystem.
+        runner (Callable[[Dict], None]): Runs one job descriptor. Defaults to
+            the regular simulation pipeline, which saves the results with
+            save_results_as_parquet.
+        worker_id (str, optional): Name recorded in the leases. Defaults to '<hostname>-<pid>'.
+        poll_interval (float): Seconds to wait when other workers still hold leases.
+        lease_timeout (float): Seconds without a heartbeat before a lease is
+            considered stale. Must be well above `heartbeat_interval` and the
+            clock difference between nodes.
+        heartbeat_interval (float): Seconds between lease refreshes.
+        max_attempts (int): Number of claims a job gets before a stale lease
+            sends it to 'failed'.
+        max_jobs (int, optional): Stops after running this many jobs.
+
+    Returns:
+        Dict[str, int]: The number of jobs this worker completed and failed.
+    """
+    if heartbeat_interval >= lease_timeout:
+        raise ValueError("The heartbeat interval must be shorter than the lease timeout.")
+
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    queue = JobQueue(queue_dir)
+    summary = {DONE: 0, FAILED: 0}
+
+    while max_jobs is None or summary[DONE] + summary[FAILED] < max_jobs:
+        for job_id in queue.requeue_stale(lease_timeout, max_attempts):
+            print(Fore.YELLOW + f"[{worker_id}] Stale lease re-queued: {job_id}")
+
+        job = queue.claim(worker_id)
+        if job is None:
+            counts = queue.counts()
+            if counts[PENDING] == 0 and counts[LEASED] == 0:
+                break
+            time.sleep(poll_interval)
+            continue
+
+        print(Fore.CYAN + f"[{worker_id}] Running job {job['job_id']} (attempt {job['attempts']})")
+        heartbeat = LeaseHeartbeat(queue.lease_path(job), heartbeat_interval)
+        heartbeat.start()
+        try:
+            runner(job)
+            state = DONE
+        except (Exception, SystemExit) as e:
+            job['error'] = f"{type(e).__name__}: {e}"
+            state = FAILED
+        finally:
+            heartbeat.stop()
+
+        if heartbeat.lost or not queue.release(job, state):
+            print(Fore.RED + f"[{worker_id}] Lease lost for job {job['job_id']}; it was re-queued, discarding this result.")
+            continue
+
+        summary[state] += 1
+        if state == DONE:
+            print(Fore.GREEN + f"[{worker_id}] Job finished: {job['job_id']}")
+        else:
+            print(Fore.RED + f"[{worker_id}] Job failed: {job['job_id']} ({job['error']})")
+
+    return summary